@@ -125,14 +125,7 @@ class GoogleSheetsMetadataRepository(MetadataRepository):
             logger.info(f"Fetching tasks with status={self.ready_status}")
 
             # Read all rows from sheet
-            result = (
-                self.service.spreadsheets()
-                .values()
-                .get(spreadsheetId=self.spreadsheet_id, range=self.range_name)
-                .execute()
-            )
-
-            rows = result.get("values", [])
+            rows = self._fetch_rows()
 
             if not rows:
                 logger.warning("Sheet is empty")
@@ -193,6 +186,24 @@ class GoogleSheetsMetadataRepository(MetadataRepository):
         except Exception as e:
             raise MetadataRepositoryError(f"Failed to fetch tasks: {e}") from e
 
+    def _fetch_rows(self) -> List[List[str]]:
+        """
+        Read all rows of the configured range.
+
+        Returns:
+            List of rows (header first), empty if the sheet has no values.
+
+        Raises:
+            HttpError: If the Sheets API request fails.
+        """
+        result = (
+            self.service.spreadsheets()
+            .values()
+            .get(spreadsheetId=self.spreadsheet_id, range=self.range_name, majorDimension="ROWS")
+            .execute()
+        )
+        return result.get("values", [])
+
     def _build_header_map(self, header: List[str]) -> dict[str, int] | None:
         """
         Build header_map from header row.
@@ -246,14 +257,7 @@ class GoogleSheetsMetadataRepository(MetadataRepository):
             return
 
         try:
-            result = (
-                self.service.spreadsheets()
-                .values()
-                .get(spreadsheetId=self.spreadsheet_id, range=self.range_name, majorDimension="ROWS")
-                .execute()
-            )
-
-            rows = result.get("values", [])
+            rows = self._fetch_rows()
             if not rows:
                 logger.warning("Sheet is empty, using COLUMN_MAP fallback for writes")
                 self._header_map = None
@@ -1,5 +1,6 @@
 """Main CLI application for YouTube video publishing."""
 import argparse
+import functools
 import logging
 import os
 import sys
@@ -85,9 +86,14 @@ def create_publish_service(dry_run: bool = False, max_retries: int = 3) -> Publi
         sys.exit(1)
 
 
-def main() -> None:
-    """Main CLI entry point."""
-    # Parse arguments
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser (constructed once per process).
+
+    Returns:
+        Configured ArgumentParser.
+    """
     parser = argparse.ArgumentParser(
         description="YouTube Publisher - Automated video publishing from Google Sheets",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -136,7 +142,26 @@ Examples:
         help="Enable verbose debug logging",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse CLI arguments.
+
+    Args:
+        argv: Argument list; defaults to sys.argv[1:].
+
+    Returns:
+        Parsed arguments.
+    """
+    return build_parser().parse_args(argv)
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    # Parse arguments
+    args = parse_args()
 
     # Load environment variables
     env_file = Path(".env")
@@ -171,14 +196,14 @@ Examples:
         logger.info("=" * 60)
         logger.info("Workflow completed")
         logger.info("=" * 60)
-        logger.info(f"  Processed: {stats['processed']}")
-        logger.info(f"  Succeeded: {stats['succeeded']}")
-        logger.info(f"  Failed:    {stats['failed']}")
-        logger.info(f"  Skipped:   {stats['skipped']}")
+        logger.info(f"  Processed: {stats.processed}")
+        logger.info(f"  Succeeded: {stats.succeeded}")
+        logger.info(f"  Failed:    {stats.failed}")
+        logger.info(f"  Skipped:   {stats.skipped}")
         logger.info("=" * 60)
 
         # Exit with error code if any tasks failed
-        if stats["failed"] > 0:
+        if stats.failed > 0:
             sys.exit(1)
 
     except KeyboardInterrupt:
@@ -1,5 +1,6 @@
 """Domain service for video publishing orchestration."""
 import logging
+from collections import namedtuple
 from datetime import datetime
 from typing import Optional
 
@@ -10,6 +11,8 @@ from ports.video_backend import RetryableError, VideoBackend, VideoBackendError
 
 logger = logging.getLogger(__name__)
 
+Stats = namedtuple("Stats", "processed succeeded failed skipped")
+
 
 class PublishService:
     """
@@ -48,18 +51,18 @@ class PublishService:
         self.max_retries = max_retries
         self.dry_run = dry_run
 
-    def publish_all_ready_tasks(self) -> dict:
+    def publish_all_ready_tasks(self) -> Stats:
         """
         Process all tasks with READY status.
 
         Returns:
-            Summary dict with counts: processed, succeeded, failed, skipped.
+            Stats with counts: processed, succeeded, failed, skipped.
         """
         logger.info("Starting publish workflow")
         tasks = self.metadata_repo.get_ready_tasks()
         logger.info(f"Found {len(tasks)} tasks with READY status")
 
-        stats = {
+        counts = {
             "processed": 0,
             "succeeded": 0,
             "failed": 0,
@@ -69,29 +72,29 @@ class PublishService:
         for task in tasks:
             try:
                 result = self.publish_task(task)
-                stats["processed"] += 1
+                counts["processed"] += 1
 
                 if result == "skipped":
-                    stats["skipped"] += 1
+                    counts["skipped"] += 1
                 elif result == "success":
-                    stats["succeeded"] += 1
+                    counts["succeeded"] += 1
                 else:
-                    stats["failed"] += 1
+                    counts["failed"] += 1
 
             except Exception as e:
                 logger.exception(f"Unexpected error processing task {task.task_id}: {e}")
-                stats["processed"] += 1
-                stats["failed"] += 1
+                counts["processed"] += 1
+                counts["failed"] += 1
 
         logger.info(
             f"Publish workflow completed: "
-            f"processed={stats['processed']}, "
-            f"succeeded={stats['succeeded']}, "
-            f"failed={stats['failed']}, "
-            f"skipped={stats['skipped']}"
+            f"processed={counts['processed']}, "
+            f"succeeded={counts['succeeded']}, "
+            f"failed={counts['failed']}, "
+            f"skipped={counts['skipped']}"
         )
 
-        return stats
+        return Stats(**counts)
 
     def publish_task(self, task: VideoTask) -> str:
         """
@@ -0,0 +1,24 @@
+import functools
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@functools.lru_cache(maxsize=None)
+def _run_cli(*args: str) -> subprocess.CompletedProcess:
+    """Run the CLI once per unique argv and reuse the result."""
+    return subprocess.run(
+        [sys.executable, "-s", "-m", "app.main", *args],
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        timeout=3,
+    )
+
+
+@pytest.fixture(scope="session")
+def cli_help_result() -> subprocess.CompletedProcess:
+    """Result of `python -m app.main --help`, shared by all CLI smoke tests."""
+    return _run_cli("--help")
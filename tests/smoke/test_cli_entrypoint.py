@@ -1,16 +1,12 @@
 import pytest
-import subprocess
-import sys
 
 
 @pytest.mark.smoke
-def test_cli_help_command():
-    result = subprocess.run(
-        [sys.executable, "-m", "app.main", "--help"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    assert result.returncode == 0
-    assert "YouTube Publisher" in result.stdout
-    assert "--dry-run" in result.stdout
+def test_cli_help_exits_successfully(cli_help_result):
+    assert cli_help_result.returncode == 0
+
+
+@pytest.mark.smoke
+def test_cli_help_describes_options(cli_help_result):
+    assert "YouTube Publisher" in cli_help_result.stdout
+    assert "--dry-run" in cli_help_result.stdout
@@ -1,30 +1,33 @@
-import pytest
-
-
-@pytest.mark.smoke
-def test_import_domain():
-    import domain.models
-    import domain.services
-    assert domain.models.VideoTask is not None
+import importlib
+import importlib.util
 
-
-@pytest.mark.smoke
-def test_import_adapters():
-    import adapters.google_sheets_repository
-    import adapters.youtube_backend
-    import adapters.local_storage
-    assert adapters.google_sheets_repository.GoogleSheetsMetadataRepository is not None
+import pytest
 
 
 @pytest.mark.smoke
-def test_import_ports():
-    import ports.metadata_repository
-    import ports.video_backend
-    import ports.storage
-    assert ports.metadata_repository.MetadataRepository is not None
+@pytest.mark.parametrize(
+    "modname",
+    [
+        "domain.models",
+        "domain.services",
+        "adapters.google_sheets_repository",
+        "adapters.youtube_backend",
+        "adapters.local_storage",
+        "ports.metadata_repository",
+        "ports.video_backend",
+        "ports.storage",
+        "app.main",
+    ],
+)
+def test_module_is_importable(modname):
+    assert importlib.util.find_spec(modname) is not None
 
 
 @pytest.mark.smoke
-def test_import_app():
-    import app.main
-    assert app.main.main is not None
+@pytest.mark.parametrize(
+    "attr",
+    ["main", "GoogleSheetsMetadataRepository", "LocalFileStorage", "YouTubeApiBackend", "PublishService"],
+)
+def test_entrypoint_wires_all_layers(attr):
+    module = importlib.import_module("app.main")
+    assert getattr(module, attr) is not None
@@ -0,0 +1,123 @@
+"""Unit tests for LocalFileStorage."""
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from adapters.local_storage import LocalFileStorage
+from ports.storage import StorageError
+
+pytestmark = pytest.mark.unit
+
+BASE_PATH = "/base"
+
+
+@dataclass(frozen=True, slots=True)
+class StorageEnv:
+    """Fake filesystem, base directory and storage under test."""
+    fs: FakeFilesystem
+    base: Path
+    storage: LocalFileStorage
+
+
+@pytest.fixture(scope="module")
+def env(fs_module):
+    """In-memory filesystem and LocalFileStorage shared by every test in this module."""
+    fs_module.create_dir(BASE_PATH)
+    return StorageEnv(
+        fs=fs_module,
+        base=Path(BASE_PATH),
+        storage=LocalFileStorage(base_path=BASE_PATH),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clean_fs(env):
+    """Remove whatever a test created so the next one starts from an empty base directory."""
+    top_level = set(os.listdir("/"))
+    yield
+    for entry in set(os.listdir("/")) - top_level:
+        shutil.rmtree(os.path.join("/", entry))
+    for entry in os.scandir(BASE_PATH):
+        if entry.is_dir():
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+
+def test_init_uses_given_base_path(env):
+    """Test that base_path is taken from the constructor."""
+    assert env.storage.base_path == env.base
+
+
+def test_init_defaults_to_cwd(env, monkeypatch):
+    """Test that base_path falls back to the current directory."""
+    env.fs.create_dir("/work")
+    monkeypatch.chdir("/work")
+
+    storage = LocalFileStorage()
+
+    assert storage.base_path == Path("/work")
+
+
+def test_exists_relative_file(env):
+    """Test that relative paths resolve against base_path."""
+    env.fs.create_file(env.base / "videos" / "video.mp4")
+
+    assert env.storage.exists("videos/video.mp4") is True
+
+
+def test_exists_absolute_file_outside_base(env):
+    """Test that absolute paths bypass base_path."""
+    env.fs.create_file("/elsewhere/video.mp4")
+
+    assert env.storage.exists("/elsewhere/video.mp4") is True
+
+
+def test_exists_missing_file(env):
+    """Test that a missing file is reported as not existing."""
+    assert env.storage.exists("missing.mp4") is False
+
+
+def test_exists_directory_is_not_file(env):
+    """Test that directories are not treated as files."""
+    env.fs.create_dir(env.base / "videos")
+
+    assert env.storage.exists("videos") is False
+
+
+def test_get_path_returns_absolute_path(env):
+    """Test that get_path resolves to an absolute path."""
+    env.fs.create_file(env.base / "video.mp4")
+
+    assert env.storage.get_path("video.mp4") == env.base / "video.mp4"
+
+
+def test_get_path_missing_file_raises(env):
+    """Test that get_path raises for a missing file."""
+    with pytest.raises(StorageError, match="does not exist"):
+        env.storage.get_path("missing.mp4")
+
+
+def test_get_path_directory_raises(env):
+    """Test that get_path raises for a directory."""
+    env.fs.create_dir(env.base / "videos")
+
+    with pytest.raises(StorageError, match="not a file"):
+        env.storage.get_path("videos")
+
+
+def test_get_size_returns_file_size(env):
+    """Test that get_size returns the size in bytes."""
+    env.fs.create_file(env.base / "video.mp4", st_size=1024)
+
+    assert env.storage.get_size("video.mp4") == 1024
+
+
+def test_get_size_missing_file_raises(env):
+    """Test that get_size raises for a missing file."""
+    with pytest.raises(StorageError):
+        env.storage.get_size("missing.mp4")
@@ -0,0 +1,29 @@
+"""Unit tests for the app.main CLI argument parsing."""
+import pytest
+
+from app.main import build_parser, parse_args
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        pytest.param([], {"dry_run": False, "max_retries": 3, "verbose": False}, id="defaults"),
+        pytest.param(["--dry-run"], {"dry_run": True}, id="dry_run"),
+        pytest.param(["--max-retries", "5"], {"max_retries": 5}, id="max_retries"),
+        pytest.param(["-v"], {"verbose": True}, id="verbose_short"),
+        pytest.param(["--verbose"], {"verbose": True}, id="verbose_long"),
+    ],
+)
+def test_parse_args(argv, expected):
+    """Test that CLI flags map onto the parsed namespace."""
+    args = parse_args(argv)
+
+    for name, value in expected.items():
+        assert getattr(args, name) == value, name
+
+
+def test_build_parser_is_reused():
+    """Test that the parser is built once and shared across parse_args calls."""
+    assert build_parser() is build_parser()
@@ -0,0 +1,131 @@
+"""Shared fakes and fixtures for domain unit tests."""
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from domain.models import PublishResult, TaskStatus, VideoTask
+from ports.metadata_repository import MetadataRepository
+from ports.storage import Storage
+from ports.video_backend import VideoBackend
+
+
+def _next_result(results):
+    """Pop the next scripted result (the last one repeats) and raise it if it is an exception."""
+    result = results[0] if len(results) == 1 else results.pop(0)
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+class FakeMetadataRepo(MetadataRepository):
+    """In-memory metadata repository that records status updates and attempts."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.ready = []
+        self.status_calls = []
+        self.attempt_calls = []
+
+    def get_ready_tasks(self):
+        return list(self.ready)
+
+    def update_task_status(self, task, status, youtube_video_id=None, error_message=None):
+        self.status_calls.append(
+            {
+                "task": task,
+                "status": status,
+                "youtube_video_id": youtube_video_id,
+                "error_message": error_message,
+            }
+        )
+
+    def increment_attempts(self, task):
+        self.attempt_calls.append(task)
+
+
+class FakeStorage(Storage):
+    """Storage answering exists from a scripted result list and resolving paths as given."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.exists_results = [True]
+        self.exists_calls = []
+
+    def exists(self, path):
+        self.exists_calls.append(path)
+        return _next_result(self.exists_results)
+
+    def get_path(self, path):
+        return Path(path)
+
+    def get_size(self, path):
+        return 0
+
+
+class FakeVideoBackend(VideoBackend):
+    """Video backend returning scripted publish results and recording uploads."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.publish_results = [
+            PublishResult(success=True, video_id="abc123", status=TaskStatus.SCHEDULED)
+        ]
+        self.publish_calls = []
+        self.thumbnail_calls = []
+
+    def publish_video(self, task, video_path):
+        self.publish_calls.append((task, video_path))
+        return _next_result(self.publish_results)
+
+    def upload_thumbnail(self, video_id, thumbnail_path):
+        self.thumbnail_calls.append((video_id, thumbnail_path))
+        return True
+
+
+TEMPLATE_TASK = VideoTask(
+    task_id="test_001",
+    row_index=2,
+    video_file_path="/videos/test.mp4",
+    title="Test Video",
+    description="Test description",
+    tags=["test", "demo"],
+    status=TaskStatus.READY,
+)
+
+
+@pytest.fixture(scope="module")
+def fake_metadata_repo():
+    """Fake metadata repository shared by the module."""
+    return FakeMetadataRepo()
+
+
+@pytest.fixture(scope="module")
+def fake_storage():
+    """Fake storage shared by the module."""
+    return FakeStorage()
+
+
+@pytest.fixture(scope="module")
+def fake_video_backend():
+    """Fake video backend shared by the module."""
+    return FakeVideoBackend()
+
+
+@pytest.fixture(autouse=True)
+def _reset_fakes(fake_metadata_repo, fake_storage, fake_video_backend):
+    """Restore the module-scoped fakes to their defaults so no state bleeds between tests."""
+    for fake in (fake_metadata_repo, fake_storage, fake_video_backend):
+        fake.reset()
+
+
+@pytest.fixture
+def sample_task():
+    """Sample video task, copied from TEMPLATE_TASK so tests may mutate it."""
+    return dataclasses.replace(TEMPLATE_TASK, tags=list(TEMPLATE_TASK.tags))
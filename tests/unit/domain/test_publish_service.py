@@ -1,310 +1,200 @@
 """Unit tests for PublishService."""
+import dataclasses
 import pytest
-from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, MagicMock, call
 
-from domain.models import VideoTask, TaskStatus, PrivacyStatus, PublishResult
-from domain.services import PublishService
-from ports.metadata_repository import MetadataRepository
-from ports.storage import Storage, StorageError
-from ports.video_backend import VideoBackend, RetryableError, PermanentError
+from domain.models import VideoTask, TaskStatus, PublishResult
+from domain.services import PublishService, Stats
+from ports.storage import StorageError
+from ports.video_backend import RetryableError, PermanentError
 
 
 @pytest.fixture
-def mock_metadata_repo():
-    """Mock metadata repository."""
-    return Mock(spec=MetadataRepository)
-
-
-@pytest.fixture
-def mock_storage():
-    """Mock storage."""
-    return Mock(spec=Storage)
-
-
-@pytest.fixture
-def mock_video_backend():
-    """Mock video backend."""
-    return Mock(spec=VideoBackend)
-
-
-@pytest.fixture
-def sample_task():
-    """Sample video task."""
-    return VideoTask(
-        task_id="test_001",
-        row_index=2,
-        video_file_path="/videos/test.mp4",
-        title="Test Video",
-        description="Test description",
-        tags=["test", "demo"],
-        status=TaskStatus.READY,
-    )
-
-
-@pytest.mark.unit
-class TestPublishServiceHappyPath:
-    """Test successful publishing scenarios."""
-
-    def test_successful_publish(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
-    ):
-        """Test successful video publishing."""
-        # Arrange
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.return_value = True
-        mock_storage.get_path.return_value = Path("/videos/test.mp4")
-
-        mock_video_backend.publish_video.return_value = PublishResult(
-            success=True,
-            video_id="abc123",
-            status=TaskStatus.SCHEDULED,
-            publish_at=None,
-        )
-
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-        )
-
-        # Act
-        stats = service.publish_all_ready_tasks()
-
-        # Assert
-        assert stats["processed"] == 1
-        assert stats["succeeded"] == 1
-        assert stats["failed"] == 0
-        assert stats["skipped"] == 0
-
-        # Verify interactions
-        mock_metadata_repo.get_ready_tasks.assert_called_once()
-        mock_storage.exists.assert_called_with("/videos/test.mp4")
-        mock_video_backend.publish_video.assert_called_once()
-        mock_metadata_repo.update_task_status.assert_called_with(
-            sample_task,
-            status=TaskStatus.SCHEDULED.value,
-            youtube_video_id="abc123",
+def make_service(fake_metadata_repo, fake_storage, fake_video_backend):
+    """Return a factory building PublishService over the fakes with keyword overrides."""
+    def _make(**kwargs):
+        return PublishService(
+            metadata_repo=fake_metadata_repo,
+            storage=fake_storage,
+            video_backend=fake_video_backend,
+            **kwargs,
         )
-        mock_metadata_repo.increment_attempts.assert_called_once_with(sample_task)
 
-    def test_successful_publish_with_thumbnail(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
-    ):
-        """Test publishing with thumbnail upload."""
-        # Arrange
-        sample_task.thumbnail_path = "/thumbnails/test.jpg"
-
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.return_value = True
-        mock_storage.get_path.side_effect = [
-            Path("/videos/test.mp4"),
-            Path("/thumbnails/test.jpg"),
-        ]
-
-        mock_video_backend.publish_video.return_value = PublishResult(
-            success=True,
-            video_id="abc123",
-            status=TaskStatus.SCHEDULED,
-        )
-        mock_video_backend.upload_thumbnail.return_value = True
-
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-        )
-
-        # Act
-        stats = service.publish_all_ready_tasks()
-
-        # Assert
-        assert stats["succeeded"] == 1
-        mock_video_backend.upload_thumbnail.assert_called_once_with(
-            "abc123", Path("/thumbnails/test.jpg")
-        )
+    return _make
 
 
 @pytest.mark.unit
-class TestPublishServiceIdempotency:
-    """Test idempotency - skip already uploaded tasks."""
-
-    def test_skip_already_uploaded(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
+class TestPublishServiceOutcomes:
+    """Test per-task outcomes: published, published with thumbnail, skipped."""
+
+    @pytest.mark.parametrize(
+        "task_changes,expected_stats,expected_statuses,expected_thumbnails",
+        [
+            pytest.param(
+                {},
+                Stats(processed=1, succeeded=1, failed=0, skipped=0),
+                [TaskStatus.UPLOADING.value, TaskStatus.SCHEDULED.value],
+                [],
+                id="published",
+            ),
+            pytest.param(
+                {"thumbnail_path": "/thumbnails/test.jpg"},
+                Stats(processed=1, succeeded=1, failed=0, skipped=0),
+                [TaskStatus.UPLOADING.value, TaskStatus.SCHEDULED.value],
+                [("abc123", Path("/thumbnails/test.jpg"))],
+                id="published_with_thumbnail",
+            ),
+            pytest.param(
+                {"youtube_video_id": "existing123"},
+                Stats(processed=1, succeeded=0, failed=0, skipped=1),
+                [],
+                [],
+                id="already_uploaded",
+            ),
+        ],
+    )
+    def test_publish_outcomes(
+        self,
+        make_service,
+        fake_metadata_repo,
+        fake_storage,
+        fake_video_backend,
+        sample_task,
+        task_changes,
+        expected_stats,
+        expected_statuses,
+        expected_thumbnails,
     ):
-        """Test that tasks with youtube_video_id are skipped."""
+        """Test the stats, status updates and uploads produced for a single task."""
         # Arrange
-        sample_task.youtube_video_id = "existing123"
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
+        task = dataclasses.replace(sample_task, **task_changes)
+        fake_metadata_repo.ready = [task]
 
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-        )
+        service = make_service()
 
         # Act
         stats = service.publish_all_ready_tasks()
 
         # Assert
-        assert stats["processed"] == 1
-        assert stats["skipped"] == 1
-        assert stats["succeeded"] == 0
+        assert stats == expected_stats
+        assert [c["status"] for c in fake_metadata_repo.status_calls] == expected_statuses
+        assert fake_video_backend.thumbnail_calls == expected_thumbnails
 
-        # Should not attempt upload
-        mock_video_backend.publish_video.assert_not_called()
-        mock_storage.exists.assert_not_called()
+        if expected_stats.skipped:
+            assert fake_storage.exists_calls == []
+            assert fake_video_backend.publish_calls == []
+            assert fake_metadata_repo.attempt_calls == []
+        else:
+            assert fake_storage.exists_calls[0] == "/videos/test.mp4"
+            assert fake_video_backend.publish_calls == [(task, Path("/videos/test.mp4"))]
+            assert fake_metadata_repo.attempt_calls == [task]
+            assert fake_metadata_repo.status_calls[-1]["youtube_video_id"] == "abc123"
 
 
 @pytest.mark.unit
 class TestPublishServiceValidation:
     """Test validation errors."""
 
-    def test_video_file_not_found(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
+    @pytest.mark.parametrize(
+        "exists_results,error_fragment,dry_run",
+        [
+            pytest.param([False], "video file not found", False, id="file_not_found"),
+            pytest.param(
+                [StorageError("Storage unavailable")],
+                "storage error: storage unavailable",
+                False,
+                id="storage_unavailable",
+            ),
+            pytest.param([False], "video file not found", True, id="dry_run_file_not_found"),
+        ],
+    )
+    def test_validation_error_paths(
+        self,
+        make_service,
+        fake_metadata_repo,
+        fake_storage,
+        fake_video_backend,
+        sample_task,
+        exists_results,
+        error_fragment,
+        dry_run,
     ):
-        """Test handling of missing video file."""
+        """Test that storage validation failures mark the task failed without uploading."""
         # Arrange
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.return_value = False
+        fake_metadata_repo.ready = [sample_task]
+        fake_storage.exists_results = list(exists_results)
 
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-        )
+        service = make_service(dry_run=dry_run)
 
         # Act
         stats = service.publish_all_ready_tasks()
 
         # Assert
-        assert stats["failed"] == 1
-        assert stats["succeeded"] == 0
-
-        # Should not attempt upload
-        mock_video_backend.publish_video.assert_not_called()
-
-        # Should mark as failed
-        mock_metadata_repo.update_task_status.assert_called_once()
-        call_args = mock_metadata_repo.update_task_status.call_args
-        assert call_args[1]["status"] == TaskStatus.FAILED.value
-        assert "not found" in call_args[1]["error_message"].lower()
-
-    def test_storage_error(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
-    ):
-        """Test handling of storage errors."""
-        # Arrange
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.side_effect = StorageError("Storage unavailable")
+        assert stats == Stats(processed=1, succeeded=0, failed=1, skipped=0)
+        assert fake_video_backend.publish_calls == []
 
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-        )
-
-        # Act
-        stats = service.publish_all_ready_tasks()
-
-        # Assert
-        assert stats["failed"] == 1
-        mock_video_backend.publish_video.assert_not_called()
+        assert len(fake_metadata_repo.status_calls) == 1
+        status_call = fake_metadata_repo.status_calls[0]
+        assert status_call["status"] == TaskStatus.FAILED.value
+        assert error_fragment in status_call["error_message"].lower()
 
 
 @pytest.mark.unit
 class TestPublishServiceRetry:
     """Test retry logic for retryable errors."""
 
-    def test_retry_on_retryable_error_then_success(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
-    ):
-        """Test retry succeeds after temporary failure."""
-        # Arrange
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.return_value = True
-        mock_storage.get_path.return_value = Path("/videos/test.mp4")
-
-        # First attempt fails, second succeeds
-        mock_video_backend.publish_video.side_effect = [
-            RetryableError("Rate limit exceeded"),
-            PublishResult(success=True, video_id="abc123", status=TaskStatus.SCHEDULED),
-        ]
-
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-            max_retries=3,
-        )
-
-        # Act
-        stats = service.publish_all_ready_tasks()
-
-        # Assert
-        assert stats["succeeded"] == 1
-        assert mock_video_backend.publish_video.call_count == 2
-        assert mock_metadata_repo.increment_attempts.call_count == 2
-
-    def test_retry_exhausted(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
+    @pytest.mark.parametrize(
+        "publish_results,expected_calls,expected_stats",
+        [
+            pytest.param(
+                [
+                    RetryableError("Rate limit exceeded"),
+                    PublishResult(success=True, video_id="abc123", status=TaskStatus.SCHEDULED),
+                ],
+                2,
+                Stats(processed=1, succeeded=1, failed=0, skipped=0),
+                id="retryable_then_success",
+            ),
+            pytest.param(
+                [RetryableError("Network error")],
+                3,
+                Stats(processed=1, succeeded=0, failed=1, skipped=0),
+                id="retries_exhausted",
+            ),
+            pytest.param(
+                [PermanentError("Invalid video format")],
+                1,
+                Stats(processed=1, succeeded=0, failed=1, skipped=0),
+                id="permanent_no_retry",
+            ),
+        ],
+    )
+    def test_publish_retries(
+        self,
+        make_service,
+        fake_metadata_repo,
+        fake_video_backend,
+        sample_task,
+        publish_results,
+        expected_calls,
+        expected_stats,
     ):
-        """Test max retries exceeded."""
+        """Test that retryable errors are retried up to max_retries and permanent ones are not."""
         # Arrange
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.return_value = True
-        mock_storage.get_path.return_value = Path("/videos/test.mp4")
-
-        # All attempts fail
-        mock_video_backend.publish_video.side_effect = RetryableError("Network error")
-
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-            max_retries=3,
-        )
-
-        # Act
-        stats = service.publish_all_ready_tasks()
-
-        # Assert
-        assert stats["failed"] == 1
-        assert stats["succeeded"] == 0
-        assert mock_video_backend.publish_video.call_count == 3  # max_retries
-        assert mock_metadata_repo.increment_attempts.call_count == 3
+        fake_metadata_repo.ready = [sample_task]
+        fake_video_backend.publish_results = list(publish_results)
 
-        # Should mark as failed
-        call_args = mock_metadata_repo.update_task_status.call_args
-        assert call_args[1]["status"] == TaskStatus.FAILED.value
-
-    def test_no_retry_on_permanent_error(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
-    ):
-        """Test permanent errors don't trigger retries."""
-        # Arrange
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.return_value = True
-        mock_storage.get_path.return_value = Path("/videos/test.mp4")
-
-        # Permanent error
-        mock_video_backend.publish_video.side_effect = PermanentError("Invalid video format")
-
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-            max_retries=3,
-        )
+        service = make_service(max_retries=3)
 
         # Act
         stats = service.publish_all_ready_tasks()
 
         # Assert
-        assert stats["failed"] == 1
-        assert mock_video_backend.publish_video.call_count == 1  # No retries
-        assert mock_metadata_repo.increment_attempts.call_count == 1
+        assert stats == expected_stats
+        assert len(fake_video_backend.publish_calls) == expected_calls
+        assert len(fake_metadata_repo.attempt_calls) == expected_calls
+        if expected_stats.failed:
+            assert fake_metadata_repo.status_calls[-1]["status"] == TaskStatus.FAILED.value
 
 
 @pytest.mark.unit
@@ -312,60 +202,28 @@ class TestPublishServiceDryRun:
     """Test dry-run mode."""
 
     def test_dry_run_validates_only(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
+        self, make_service, fake_metadata_repo, fake_video_backend, sample_task
     ):
         """Test dry-run mode validates but doesn't upload."""
         # Arrange
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.return_value = True
-        mock_storage.get_path.return_value = Path("/videos/test.mp4")
-
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-            dry_run=True,
-        )
+        fake_metadata_repo.ready = [sample_task]
+
+        service = make_service(dry_run=True)
 
         # Act
         stats = service.publish_all_ready_tasks()
 
         # Assert
-        assert stats["succeeded"] == 1
+        assert stats == Stats(processed=1, succeeded=1, failed=0, skipped=0)
 
         # Should NOT upload
-        mock_video_backend.publish_video.assert_not_called()
-        mock_video_backend.upload_thumbnail.assert_not_called()
+        assert fake_video_backend.publish_calls == []
+        assert fake_video_backend.thumbnail_calls == []
 
         # Should update status to DRY_RUN_OK
-        mock_metadata_repo.update_task_status.assert_called_once()
-        call_args = mock_metadata_repo.update_task_status.call_args
-        assert call_args[0][1] == TaskStatus.DRY_RUN_OK.value
-
-    def test_dry_run_catches_validation_errors(
-        self, mock_metadata_repo, mock_storage, mock_video_backend, sample_task
-    ):
-        """Test dry-run mode still validates and catches errors."""
-        # Arrange
-        mock_metadata_repo.get_ready_tasks.return_value = [sample_task]
-        mock_storage.exists.return_value = False  # File missing
-
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-            dry_run=True,
-        )
-
-        # Act
-        stats = service.publish_all_ready_tasks()
-
-        # Assert
-        assert stats["failed"] == 1
-
-        # Should mark as failed
-        call_args = mock_metadata_repo.update_task_status.call_args
-        assert call_args[1]["status"] == TaskStatus.FAILED.value
+        assert [c["status"] for c in fake_metadata_repo.status_calls] == [
+            TaskStatus.DRY_RUN_OK.value
+        ]
 
 
 @pytest.mark.unit
@@ -373,49 +231,29 @@ class TestPublishServiceMultipleTasks:
     """Test processing multiple tasks."""
 
     def test_multiple_tasks_mixed_results(
-        self, mock_metadata_repo, mock_storage, mock_video_backend
+        self, make_service, fake_metadata_repo, fake_storage, fake_video_backend
     ):
         """Test processing multiple tasks with different outcomes."""
         # Arrange
-        task1 = VideoTask(
-            task_id="task1",
-            row_index=2,
-            video_file_path="/videos/video1.mp4",
-            title="Video 1",
-        )
-        task2 = VideoTask(
-            task_id="task2",
-            row_index=3,
-            video_file_path="/videos/video2.mp4",
-            title="Video 2",
-            youtube_video_id="existing123",  # Already uploaded
-        )
-        task3 = VideoTask(
-            task_id="task3",
-            row_index=4,
-            video_file_path="/videos/video3.mp4",
-            title="Video 3",
-        )
-
-        mock_metadata_repo.get_ready_tasks.return_value = [task1, task2, task3]
-        mock_storage.exists.side_effect = [True, False]  # task1 exists, task3 doesn't
-        mock_storage.get_path.return_value = Path("/videos/video1.mp4")
+        tasks = [
+            VideoTask(
+                task_id=f"task{i}",
+                row_index=i + 1,
+                video_file_path=f"/videos/video{i}.mp4",
+                title=f"Video {i}",
+                **extra,
+            )
+            for i, extra in enumerate([{}, {"youtube_video_id": "existing123"}, {}], start=1)
+        ]
 
-        mock_video_backend.publish_video.return_value = PublishResult(
-            success=True, video_id="abc123", status=TaskStatus.SCHEDULED
-        )
+        fake_metadata_repo.ready = tasks
+        fake_storage.exists_results = [True, False]
 
-        service = PublishService(
-            metadata_repo=mock_metadata_repo,
-            storage=mock_storage,
-            video_backend=mock_video_backend,
-        )
+        service = make_service()
 
         # Act
         stats = service.publish_all_ready_tasks()
 
         # Assert
-        assert stats["processed"] == 3
-        assert stats["succeeded"] == 1  # task1
-        assert stats["skipped"] == 1  # task2 (already uploaded)
-        assert stats["failed"] == 1  # task3 (file not found)
+        assert len(fake_video_backend.publish_calls) == 1
+        assert stats == Stats(processed=3, succeeded=1, failed=1, skipped=1)
@@ -0,0 +1,228 @@
+"""Unit tests for drive_delete retry and rate-limit logic."""
+import json
+
+import pytest
+from googleapiclient.errors import BatchError, HttpError
+from httplib2 import Response
+
+from utils import drive_delete
+
+pytestmark = pytest.mark.unit
+
+RATE_LIMIT_BODY = json.dumps(
+    {"error": {"code": 403, "message": "Rate Limit Exceeded", "errors": [{"reason": "rateLimitExceeded"}]}}
+).encode()
+RATE_LIMIT_WITH_DETAILS_BODY = json.dumps(
+    {
+        "error": {
+            "code": 403,
+            "message": "Rate Limit Exceeded",
+            "details": [{"@type": "type.googleapis.com/google.rpc.ErrorInfo", "reason": "RATE_LIMIT_EXCEEDED"}],
+            "errors": [{"reason": "userRateLimitExceeded"}],
+        }
+    }
+).encode()
+PERMISSION_BODY = json.dumps(
+    {"error": {"code": 403, "message": "Forbidden", "errors": [{"reason": "insufficientFilePermissions"}]}}
+).encode()
+
+
+def http_error(status: int, body: bytes = b"") -> HttpError:
+    """Build an HttpError with the given status and response body."""
+    return HttpError(Response({"status": str(status)}), body)
+
+
+class FakeDeleteRequest:
+    """files().delete() request replaying the scripted outcomes for its file."""
+
+    def __init__(self, drive, file_id):
+        self.drive = drive
+        self.file_id = file_id
+
+    def execute(self):
+        self.drive.executed.append(self.file_id)
+        error = self.drive.next_item_result(self.file_id)
+        if error:
+            raise error
+        return {}
+
+
+class FakeBatch:
+    """Batch request that records its file IDs and reports scripted per-file outcomes."""
+
+    def __init__(self, drive, callback):
+        self.drive = drive
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.drive.batches.append([request.file_id for _, request in self.requests])
+        if self.drive.batch_results:
+            error = self.drive.batch_results.pop(0)
+            if error:
+                raise error
+        for request_id, request in self.requests:
+            self.callback(request_id, {}, self.drive.next_item_result(request.file_id))
+
+
+class FakeDrive:
+    """Drive stub: item_results maps file ID -> outcomes per attempt (last one repeats)."""
+
+    def __init__(self, item_results=None, batch_results=()):
+        self.item_results = {file_id: list(results) for file_id, results in (item_results or {}).items()}
+        self.batch_results = list(batch_results)
+        self.batches = []
+        self.executed = []
+
+    def next_item_result(self, file_id):
+        results = self.item_results.get(file_id, [None])
+        return results.pop(0) if len(results) > 1 else results[0]
+
+    def files(self):
+        return self
+
+    def delete(self, fileId):
+        return FakeDeleteRequest(self, fileId)
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+@pytest.fixture
+def sleep(mocker):
+    """Patch out backoff and rate-limit sleeps."""
+    return mocker.patch.object(drive_delete.time, "sleep")
+
+
+def files(*ids):
+    """Build input rows for the given file IDs."""
+    return [{"id": file_id, "name": f"{file_id}.mp4"} for file_id in ids]
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        pytest.param(http_error(429), True, id="too_many_requests"),
+        pytest.param(http_error(503), True, id="service_unavailable"),
+        pytest.param(http_error(403, RATE_LIMIT_BODY), True, id="403_rate_limit"),
+        pytest.param(http_error(403, RATE_LIMIT_WITH_DETAILS_BODY), True, id="403_rate_limit_with_details"),
+        pytest.param(http_error(403, PERMISSION_BODY), False, id="403_permission"),
+        pytest.param(http_error(403, b"<html>Forbidden</html>"), False, id="403_non_json"),
+        pytest.param(http_error(404), False, id="not_found"),
+        pytest.param(BatchError("Bad Content-ID"), False, id="batch_error_without_response"),
+        pytest.param(
+            BatchError("Response not in multipart/mixed format.", resp=Response({"status": "200"})),
+            False,
+            id="batch_error_malformed_response",
+        ),
+    ],
+)
+def test_is_retryable(error, expected):
+    """Test which Drive errors are retried."""
+    assert drive_delete.is_retryable(error) is expected
+
+
+class TestDeleteBatch:
+    """Test batch deletes with per-item and whole-batch retries."""
+
+    def test_retryable_item_succeeds_on_later_attempt(self, sleep):
+        """Test that only the rate-limited file is resent, and it succeeds on the retry."""
+        drive = FakeDrive(item_results={"b": [http_error(403, RATE_LIMIT_BODY), None]})
+
+        results = drive_delete.delete_batch(drive, files("a", "b"), drive_delete.TokenBucket(0))
+
+        assert results == {"a": None, "b": None}
+        assert drive.batches == [["a", "b"], ["b"]]
+        assert sleep.call_count == 1
+
+    def test_not_found_item_is_not_retried(self, sleep):
+        """Test that a 404 is reported without resending the file."""
+        not_found = http_error(404)
+        drive = FakeDrive(item_results={"b": [not_found]})
+
+        results = drive_delete.delete_batch(drive, files("a", "b"), drive_delete.TokenBucket(0))
+
+        assert results == {"a": None, "b": not_found}
+        assert drive.batches == [["a", "b"]]
+        sleep.assert_not_called()
+
+    def test_whole_batch_429_is_retried(self, sleep):
+        """Test that a batch rejected with 429 is resent in full after a backoff."""
+        drive = FakeDrive(batch_results=[http_error(429)])
+
+        results = drive_delete.delete_batch(drive, files("a", "b"), drive_delete.TokenBucket(0))
+
+        assert results == {"a": None, "b": None}
+        assert drive.batches == [["a", "b"], ["a", "b"]]
+        assert sleep.call_count == 1
+
+    def test_whole_batch_429_exhausts_attempts(self, sleep):
+        """Test that every file gets the batch error once all attempts are used."""
+        too_many = http_error(429)
+        drive = FakeDrive(batch_results=[too_many] * drive_delete.MAX_ATTEMPTS)
+
+        results = drive_delete.delete_batch(drive, files("a", "b"), drive_delete.TokenBucket(0))
+
+        assert results == {"a": too_many, "b": too_many}
+        assert len(drive.batches) == drive_delete.MAX_ATTEMPTS
+        assert sleep.call_count == drive_delete.MAX_ATTEMPTS - 1
+
+
+    def test_malformed_batch_response_fails_files(self, sleep):
+        """Test that a BatchError is recorded for every file in the batch instead of aborting the run."""
+        malformed = BatchError("Response not in multipart/mixed format.", resp=Response({"status": "200"}))
+        drive = FakeDrive(batch_results=[malformed])
+
+        success, errors = drive_delete.delete_files(drive, files("a", "b"), dry_run=False, rate=0)
+
+        assert (success, errors) == (0, 2)
+        assert drive.batches == [["a", "b"]]
+        sleep.assert_not_called()
+
+
+class TestDeleteOne:
+    """Test single-file deletes used by --workers."""
+
+    @pytest.mark.parametrize(
+        "outcomes,expected_attempts,expected_error",
+        [
+            pytest.param([http_error(503), None], 2, None, id="retryable_then_success"),
+            pytest.param([http_error(404)], 1, 404, id="not_found_not_retried"),
+            pytest.param([http_error(429)], drive_delete.MAX_ATTEMPTS, 429, id="retries_exhausted"),
+        ],
+    )
+    def test_delete_one(self, mocker, sleep, outcomes, expected_attempts, expected_error):
+        """Test that delete_one retries only retryable errors, up to MAX_ATTEMPTS."""
+        drive = FakeDrive(item_results={"a": outcomes})
+        mocker.patch.object(drive_delete, "thread_drive", return_value=drive)
+
+        error = drive_delete.delete_one("a", drive_delete.TokenBucket(0))
+
+        assert drive.executed == ["a"] * expected_attempts
+        assert (error and error.resp.status) == expected_error
+
+
+class TestTokenBucket:
+    """Test request rate limiting."""
+
+    def test_zero_rate_never_sleeps(self, sleep):
+        """Test that rate 0 disables limiting."""
+        bucket = drive_delete.TokenBucket(0)
+
+        for _ in range(100):
+            bucket.acquire()
+
+        sleep.assert_not_called()
+
+    def test_sleeps_once_burst_is_spent(self, mocker, sleep):
+        """Test that a full bucket serves `rate` requests, then waits 1/rate per request."""
+        mocker.patch.object(drive_delete.time, "monotonic", return_value=100.0)
+        bucket = drive_delete.TokenBucket(10)
+
+        for _ in range(12):
+            bucket.acquire()
+
+        assert [call.args[0] for call in sleep.call_args_list] == pytest.approx([0.1, 0.2])
@@ -0,0 +1,120 @@
+"""Unit tests for sheets_reset_verify value fetching and verification."""
+import pytest
+
+from utils import sheets_reset_verify
+
+pytestmark = pytest.mark.unit
+
+TEMPLATE_ID = "template"
+RUNTIME_ID = "runtime"
+HEADER = ["task_id", "status", "title"]
+
+
+class FakeRequest:
+    """Request whose execute() returns a prepared response or raises it."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeSheets:
+    """Sheets service stub: spreadsheets maps spreadsheet ID -> {sheet title: values}."""
+
+    def __init__(self, spreadsheets, batch_error=None):
+        self.spreadsheets_data = spreadsheets
+        self.batch_error = batch_error
+        self.batch_calls = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId, fields):
+        titles = self.spreadsheets_data[spreadsheetId]
+        return FakeRequest(
+            {"sheets": [{"properties": {"sheetId": i, "title": t}} for i, t in enumerate(titles)]}
+        )
+
+    def batchGet(self, spreadsheetId, ranges, valueRenderOption):
+        self.batch_calls.append((spreadsheetId, ranges))
+        if self.batch_error:
+            return FakeRequest(self.batch_error)
+        sheets = self.spreadsheets_data[spreadsheetId]
+        value_ranges = [{"range": f"{r}!A1:Z1000", "values": sheets[r.strip("'")]} for r in ranges]
+        return FakeRequest({"valueRanges": value_ranges})
+
+
+class TestGetSheetValuesBatch:
+    """Test batched value fetching."""
+
+    def test_values_keyed_by_requested_title(self):
+        """Test that valueRanges are mapped back to titles in request order."""
+        service = FakeSheets({TEMPLATE_ID: {"Videos": [HEADER], "Config": [["key", "value"]]}})
+
+        values = sheets_reset_verify.get_sheet_values_batch(service, TEMPLATE_ID, ["Config", "Videos"])
+
+        assert values == {"Config": [["key", "value"]], "Videos": [HEADER]}
+        assert service.batch_calls == [(TEMPLATE_ID, ["'Config'", "'Videos'"])]
+
+    def test_error_yields_empty_values(self):
+        """Test that a failed batchGet yields empty values for every title."""
+        service = FakeSheets({TEMPLATE_ID: {}}, batch_error=RuntimeError("boom"))
+
+        values = sheets_reset_verify.get_sheet_values_batch(service, TEMPLATE_ID, ["Videos"])
+
+        assert values == {"Videos": []}
+
+
+class TestVerifyMatch:
+    """Test template/runtime verification."""
+
+    @pytest.mark.parametrize(
+        "template,runtime,expected,expected_ranges",
+        [
+            pytest.param(
+                {"Config": [["a"]], "Videos": [HEADER, ["vid_001", "READY", "Title"]]},
+                {"Config": [["a"]], "Videos": [HEADER, ["vid_001", "READY", " Title ", ""]]},
+                True,
+                ["'Config'", "'Videos'"],
+                id="matching_sheets",
+            ),
+            pytest.param(
+                {"Videos": [HEADER, ["vid_001", "READY", "Title"]]},
+                {"Videos": [HEADER, ["vid_001", "SCHEDULED", "Title"]]},
+                False,
+                ["'Videos'"],
+                id="data_mismatch",
+            ),
+            pytest.param(
+                {"Config": [["a"]], "Videos": [HEADER]},
+                {"Videos": [HEADER], "Extra": [["x"]]},
+                False,
+                ["'Videos'"],
+                id="title_mismatch_checks_intersection",
+            ),
+            pytest.param(
+                {"Videos": [HEADER]},
+                {"Extra": [["x"]]},
+                False,
+                None,
+                id="no_shared_titles",
+            ),
+        ],
+    )
+    def test_verify_match(self, template, runtime, expected, expected_ranges):
+        """Test the verdict and that values are fetched only for sheets present in both spreadsheets."""
+        service = FakeSheets({TEMPLATE_ID: template, RUNTIME_ID: runtime})
+
+        assert sheets_reset_verify.verify_match(service, TEMPLATE_ID, RUNTIME_ID) is expected
+
+        if expected_ranges is None:
+            assert service.batch_calls == []
+        else:
+            assert service.batch_calls == [(TEMPLATE_ID, expected_ranges), (RUNTIME_ID, expected_ranges)]
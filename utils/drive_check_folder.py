@@ -6,13 +6,13 @@ import os
 import sys
 
 from dotenv import load_dotenv
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
 
 def get_drive_service():
     """Build Google Drive API service."""
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path:
         print("ERROR: GOOGLE_APPLICATION_CREDENTIALS env var not set", file=sys.stderr)
@@ -33,6 +33,8 @@ def check_folder(drive, folder_id: str):
     print(f"Checking folder: {folder_id}")
     print("=" * 60)
 
+    from googleapiclient.errors import HttpError
+
     try:
         result = drive.files().get(
             fileId=folder_id,
@@ -3,18 +3,85 @@
 
 import argparse
 import csv
+import itertools
 import json
 import os
+import random
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from dotenv import load_dotenv
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+BATCH_SIZE = 100
+MAX_ATTEMPTS = 6
+MAX_BACKOFF = 64
+RATE_LIMIT = 10
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+_thread_local = threading.local()
+
+
+class TokenBucket:
+    """Thread-safe token bucket capping requests per second (rate 0 disables it)."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until the bucket has refilled enough to cover it."""
+        if not self.rate:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def is_retryable(error) -> bool:
+    """Return True for 429/5xx and Drive's 403 rate-limit errors (read from the body's error.errors)."""
+    status = getattr(getattr(error, "resp", None), "status", None)
+    if status in RETRYABLE_STATUSES:
+        return True
+    if status != 403 or not error.content:
+        return False
+
+    try:
+        data = json.loads(error.content)
+    except ValueError:
+        return False
+
+    body = data.get("error") if isinstance(data, dict) else None
+    errors = body.get("errors", []) if isinstance(body, dict) else []
+    return any(isinstance(e, dict) and e.get("reason") in RATE_LIMIT_REASONS for e in errors)
+
+
+def backoff(attempt: int) -> float:
+    """Exponential backoff delay with jitter, capped at MAX_BACKOFF seconds."""
+    return min(MAX_BACKOFF, 2 ** attempt) + random.random()
 
 
 def get_drive_service():
     """Build Google Drive API service."""
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path:
         print("ERROR: GOOGLE_APPLICATION_CREDENTIALS env var not set", file=sys.stderr)
@@ -30,60 +97,157 @@ def get_drive_service():
     return build("drive", "v3", credentials=credentials)
 
 
+def read_delimited(lines, delimiter: str) -> list[dict]:
+    """Read id/name columns from csv/tsv lines by header position."""
+    reader = csv.reader(lines, delimiter=delimiter)
+    header = next(reader, [])
+    if "id" not in header:
+        return []
+
+    id_col = header.index("id")
+    name_col = header.index("name") if "name" in header else None
+
+    files = []
+    for row in reader:
+        if len(row) <= id_col:
+            continue
+        name = row[name_col] if name_col is not None and len(row) > name_col else ""
+        files.append({"id": row[id_col], "name": name})
+
+    return files
+
+
 def read_file_ids(path: str) -> list[dict]:
     """Read file IDs from input file (tsv/csv/jsonl)."""
     files = []
 
     with open(path, "r", encoding="utf-8") as fp:
         first_line = fp.readline()
-        fp.seek(0)
+        lines = itertools.chain([first_line], fp)
 
         if first_line.startswith("{"):
-            for line in fp:
+            for line in lines:
                 line = line.strip()
                 if line:
-                    data = json.loads(line)
+                    data = json_loads(line)
                     files.append({"id": data.get("id"), "name": data.get("name", "")})
 
-        elif "\t" in first_line:
-            reader = csv.DictReader(fp, delimiter="\t")
-            for row in reader:
-                files.append({"id": row.get("id"), "name": row.get("name", "")})
-
         else:
-            reader = csv.DictReader(fp)
-            for row in reader:
-                files.append({"id": row.get("id"), "name": row.get("name", "")})
+            files = read_delimited(lines, "\t" if "\t" in first_line else ",")
 
     return [f for f in files if f.get("id")]
 
 
-def delete_files(drive, files: list[dict], dry_run: bool = True) -> tuple[int, int]:
-    """Delete files by ID. Returns (success_count, error_count)."""
+def delete_batch(drive, chunk: list[dict], bucket: TokenBucket) -> dict[str, Exception | None]:
+    """Delete a chunk of files in batch requests (one rate token each), retrying rate-limited files."""
+    results = {}
+    pending = chunk
+
+    def on_response(request_id, response, exception):
+        results[pending[int(request_id)]["id"]] = exception
+
+    from googleapiclient.errors import HttpError
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        bucket.acquire()
+        batch = drive.new_batch_http_request(callback=on_response)
+        for i, f in enumerate(pending):
+            batch.add(drive.files().delete(fileId=f["id"]), request_id=str(i))
+        try:
+            batch.execute()
+        except HttpError as e:
+            if not is_retryable(e) or attempt == MAX_ATTEMPTS:
+                results.update({f["id"]: e for f in pending})
+                return results
+        else:
+            pending = [
+                f for f in pending
+                if results.get(f["id"]) is not None and is_retryable(results[f["id"]])
+            ]
+            if not pending or attempt == MAX_ATTEMPTS:
+                return results
+        time.sleep(backoff(attempt))
+
+
+def thread_drive():
+    """Return a Drive service owned by the current thread (httplib2 clients are not thread-safe)."""
+    if not hasattr(_thread_local, "drive"):
+        _thread_local.drive = get_drive_service()
+    return _thread_local.drive
+
+
+def delete_one(file_id: str, bucket: TokenBucket) -> Exception | None:
+    """Delete a single file, backing off on rate limits and 5xx. Returns the error, or None on success."""
+    from googleapiclient.errors import HttpError
+
+    drive = thread_drive()
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        bucket.acquire()
+        try:
+            drive.files().delete(fileId=file_id).execute()
+            return None
+        except HttpError as e:
+            if not is_retryable(e) or attempt == MAX_ATTEMPTS:
+                return e
+            time.sleep(backoff(attempt))
+
+
+def delete_parallel(files: list[dict], workers: int, bucket: TokenBucket) -> dict[str, Exception | None]:
+    """Delete files one request each on a thread pool. Returns file ID -> error (None on success)."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(delete_one, f["id"], bucket): f["id"] for f in files}
+        return {futures[future]: future.result() for future in as_completed(futures)}
+
+
+def report(files: list[dict], results: dict[str, Exception | None]) -> tuple[int, int]:
+    """Print per-file outcome. Returns (success_count, error_count)."""
     success = 0
     errors = 0
 
     for f in files:
         file_id = f["id"]
         name = f.get("name", "")
-
-        if dry_run:
-            print(f"[DRY-RUN] Would delete: {file_id} ({name})")
+        error = results.get(file_id)
+        if error is None:
+            print(f"[DELETED] {file_id} ({name})")
             success += 1
         else:
-            try:
-                drive.files().delete(fileId=file_id).execute()
-                print(f"[DELETED] {file_id} ({name})")
-                success += 1
-            except HttpError as e:
-                print(f"[ERROR] {file_id} ({name}): {e.reason}", file=sys.stderr)
-                errors += 1
+            print(f"[ERROR] {file_id} ({name}): {getattr(error, 'reason', error)}", file=sys.stderr)
+            errors += 1
+
+    return success, errors
+
+
+def delete_files(
+    drive, files: list[dict], dry_run: bool = True, workers: int = 0, rate: float = RATE_LIMIT
+) -> tuple[int, int]:
+    """Delete files by ID (batched, or in parallel when workers > 0) at up to `rate` HTTP requests/s."""
+    if dry_run:
+        for f in files:
+            print(f"[DRY-RUN] Would delete: {f['id']} ({f.get('name', '')})")
+        return len(files), 0
+
+    bucket = TokenBucket(rate)
+
+    if workers:
+        return report(files, delete_parallel(files, workers, bucket))
+
+    success = 0
+    errors = 0
+
+    for start in range(0, len(files), BATCH_SIZE):
+        chunk = files[start:start + BATCH_SIZE]
+        chunk_success, chunk_errors = report(chunk, delete_batch(drive, chunk, bucket))
+        success += chunk_success
+        errors += chunk_errors
 
     return success, errors
 
 
 def empty_trash(drive):
     """Empty the trash."""
+    from googleapiclient.errors import HttpError
+
     try:
         drive.files().emptyTrash().execute()
         print("[OK] Trash emptied")
@@ -109,13 +273,41 @@ Examples:
 
   # Delete and empty trash
   python drive_delete.py --input files.tsv --yes --empty-trash
+
+  # Delete with 8 parallel single-file requests instead of batch requests
+  python drive_delete.py --input files.tsv --yes --workers 8
+
+  # Allow up to 50 HTTP requests per second
+  python drive_delete.py --input files.tsv --yes --rate 50
 """,
     )
     parser.add_argument("--input", required=True, help="Input file (tsv/csv/jsonl from drive_list)")
     parser.add_argument("--yes", action="store_true", help="Actually delete files (without this flag, only dry-run)")
     parser.add_argument("--empty-trash", action="store_true", help="Empty trash after deletion")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="?",
+        const=8,
+        default=0,
+        help="Delete with N parallel single-file requests instead of batch requests (default N: 8)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=RATE_LIMIT,
+        help=(
+            f"Maximum HTTP requests per second, 0 for unlimited (default: {RATE_LIMIT}); "
+            "a batch of up to 100 deletes counts as one request"
+        ),
+    )
     args = parser.parse_args()
 
+    if args.workers < 0:
+        parser.error("--workers must be 0 or greater")
+    if args.rate < 0:
+        parser.error("--rate must be 0 or greater")
+
     if not os.path.exists(args.input):
         print(f"ERROR: Input file not found: {args.input}", file=sys.stderr)
         sys.exit(1)
@@ -139,7 +331,7 @@ Examples:
         print()
 
     drive = get_drive_service()
-    success, errors = delete_files(drive, files, dry_run=dry_run)
+    success, errors = delete_files(drive, files, dry_run=dry_run, workers=args.workers, rate=args.rate)
 
     print()
     print(f"Summary: {success} {'would be ' if dry_run else ''}deleted, {errors} errors")
@@ -9,23 +9,29 @@ import sys
 from datetime import datetime, timedelta, timezone
 
 from dotenv import load_dotenv
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+
+
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+OUTPUT_FIELDS = ["id", "name", "mimeType", "size", "createdTime", "modifiedTime", "parents"]
+OUTPUT_BUFFER_SIZE = 1 << 20
+FULL_FIELDS = "id, name, mimeType, size, createdTime, modifiedTime, parents"
+STREAM_FIELDS = "id, name, size"
+MAX_RETRIES = 5
 
 
 def format_bytes(size_bytes: int) -> str:
     """Format bytes to human readable string."""
     if size_bytes < 0:
         return "N/A"
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(size_bytes) < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} PB"
+    exp = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(BYTE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * exp)):.2f} {BYTE_UNITS[exp]}"
 
 
 def get_drive_service():
     """Build Google Drive API service."""
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path:
         print("ERROR: GOOGLE_APPLICATION_CREDENTIALS env var not set", file=sys.stderr)
@@ -41,8 +47,8 @@ def get_drive_service():
     return build("drive", "v3", credentials=credentials)
 
 
-def list_files(drive, name_prefix: str = None, older_than_days: int = None, mime_type: str = None):
-    """List all files owned by service account."""
+def build_query(name_prefix: str = None, older_than_days: int = None, mime_type: str = None) -> str:
+    """Build the files.list query for files owned by service account."""
     query_parts = ["'me' in owners", "trashed = false"]
 
     if name_prefix:
@@ -58,25 +64,34 @@ def list_files(drive, name_prefix: str = None, older_than_days: int = None, mime
         cutoff_str = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
         query_parts.append(f"modifiedTime < '{cutoff_str}'")
 
-    query = " and ".join(query_parts)
+    return " and ".join(query_parts)
 
-    files = []
-    page_token = None
 
-    while True:
-        response = drive.files().list(
-            q=query,
-            fields="nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, parents)",
-            pageSize=1000,
-            pageToken=page_token,
-        ).execute()
+def iter_pages(drive, query: str, fields: str = FULL_FIELDS):
+    """Yield each page of matching files as it arrives, requesting only the given file fields."""
+    files_api = drive.files()
+    request = files_api.list(
+        q=query,
+        fields=f"nextPageToken, files({fields})",
+        pageSize=1000,
+    )
 
-        files.extend(response.get("files", []))
-        page_token = response.get("nextPageToken")
+    while request is not None:
+        response = request.execute(num_retries=MAX_RETRIES)
+        yield response.get("files", [])
+        request = files_api.list_next(request, response)
 
-        if not page_token:
-            break
 
+def list_files(
+    drive,
+    name_prefix: str = None,
+    older_than_days: int = None,
+    mime_type: str = None,
+    fields: str = FULL_FIELDS,
+):
+    """List all files owned by service account."""
+    query = build_query(name_prefix, older_than_days, mime_type)
+    files = [f for page in iter_pages(drive, query, fields) for f in page]
     files.sort(key=lambda f: int(f.get("size", 0)), reverse=True)
     return files
 
@@ -104,32 +119,34 @@ def print_table(files):
     print(f"Total: {len(files)} files, {format_bytes(total_size)}")
 
 
-def write_output(files, path: str, fmt: str):
-    """Write files to output file."""
-    fieldnames = ["id", "name", "mimeType", "size", "createdTime", "modifiedTime", "parents"]
+def output_row(f: dict) -> list:
+    """Flatten a Drive file into OUTPUT_FIELDS order, joining parents with commas."""
+    return [f.get(k, "") for k in OUTPUT_FIELDS[:-1]] + [",".join(f.get("parents", []))]
 
-    with open(path, "w", newline="", encoding="utf-8") as fp:
-        if fmt == "jsonl":
-            for f in files:
-                row = {k: f.get(k, "") for k in fieldnames}
-                row["parents"] = ",".join(f.get("parents", []))
-                fp.write(json.dumps(row) + "\n")
 
+def write_output(pages, path: str, fmt: str):
+    """Write pages (iterables of file lists) to output file."""
+    count = 0
+
+    with open(path, "w", newline="", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as fp:
+        if fmt == "tsv":
+            writer = csv.writer(fp, delimiter="\t", lineterminator="\n")
         elif fmt == "csv":
-            writer = csv.DictWriter(fp, fieldnames=fieldnames)
-            writer.writeheader()
-            for f in files:
-                row = {k: f.get(k, "") for k in fieldnames}
-                row["parents"] = ",".join(f.get("parents", []))
-                writer.writerow(row)
+            writer = csv.writer(fp)
+        else:
+            writer = None
+
+        if writer:
+            writer.writerow(OUTPUT_FIELDS)
 
-        else:  # tsv
-            fp.write("\t".join(fieldnames) + "\n")
-            for f in files:
-                row = [str(f.get(k, "")) if k != "parents" else ",".join(f.get("parents", [])) for k in fieldnames]
-                fp.write("\t".join(row) + "\n")
+        for files in pages:
+            if writer:
+                writer.writerows(output_row(f) for f in files)
+            else:
+                fp.writelines(json.dumps(dict(zip(OUTPUT_FIELDS, output_row(f)))) + "\n" for f in files)
+            count += len(files)
 
-    print(f"Written {len(files)} files to {path} ({fmt})", file=sys.stderr)
+    print(f"Written {count} files to {path} ({fmt})", file=sys.stderr)
 
 
 def main():
@@ -141,20 +158,41 @@ def main():
     parser.add_argument("--name-prefix", help="Filter by name prefix")
     parser.add_argument("--older-than-days", type=int, help="Filter files older than N days")
     parser.add_argument("--mime-type", help="Filter by MIME type")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write pages to --out as they arrive (no table, no size sorting)",
+    )
+    parser.add_argument(
+        "--fields",
+        help=f"Comma-separated file fields to request (default: {STREAM_FIELDS} with --stream, otherwise all)",
+    )
     args = parser.parse_args()
 
+    if args.stream and not args.out:
+        parser.error("--stream requires --out")
+
+    fields = args.fields or (STREAM_FIELDS if args.stream else FULL_FIELDS)
+
     drive = get_drive_service()
+
+    if args.stream:
+        query = build_query(args.name_prefix, args.older_than_days, args.mime_type)
+        write_output(iter_pages(drive, query, fields), args.out, args.format)
+        return
+
     files = list_files(
         drive,
         name_prefix=args.name_prefix,
         older_than_days=args.older_than_days,
         mime_type=args.mime_type,
+        fields=fields,
     )
 
     print_table(files)
 
     if args.out:
-        write_output(files, args.out, args.format)
+        write_output([files], args.out, args.format)
 
 
 if __name__ == "__main__":
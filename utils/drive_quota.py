@@ -5,23 +5,24 @@ import os
 import sys
 
 from dotenv import load_dotenv
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+
+
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def format_bytes(size_bytes: int) -> str:
     """Format bytes to human readable string."""
     if size_bytes < 0:
         return "N/A"
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(size_bytes) < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} PB"
+    exp = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(BYTE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * exp)):.2f} {BYTE_UNITS[exp]}"
 
 
 def get_drive_service():
     """Build Google Drive API service."""
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path:
         print("ERROR: GOOGLE_APPLICATION_CREDENTIALS env var not set", file=sys.stderr)
@@ -3,11 +3,26 @@
 
 import json
 import os
+import re
 import sys
 
 from dotenv import load_dotenv
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+
+IDENTITY_KEYS = ("client_email", "project_id")
+IDENTITY_PATTERN = re.compile(rb'"(client_email|project_id)"\s*:\s*"([^"\\]*)"')
+
+
+def read_identity(path: str) -> dict:
+    """Extract client_email/project_id from a service-account file, parsing full JSON only as a fallback."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    identity = {key.decode(): value.decode() for key, value in IDENTITY_PATTERN.findall(data)}
+    if all(key in identity for key in IDENTITY_KEYS):
+        return identity
+
+    sa_info = json.loads(data)
+    return {key: sa_info[key] for key in IDENTITY_KEYS if key in sa_info}
 
 
 def main():
@@ -26,14 +41,16 @@ def main():
     print(f"Credentials file: {creds_path}")
     print()
 
-    with open(creds_path, "r") as f:
-        sa_info = json.load(f)
+    sa_info = read_identity(creds_path)
 
     print("From JSON file:")
     print(f"  client_email: {sa_info.get('client_email', 'N/A')}")
     print(f"  project_id:   {sa_info.get('project_id', 'N/A')}")
     print()
 
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     credentials = service_account.Credentials.from_service_account_file(
         creds_path,
         scopes=["https://www.googleapis.com/auth/drive.readonly"],
@@ -15,12 +15,13 @@ import os
 import sys
 
 from dotenv import load_dotenv
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 
 
 def get_sheets_service():
     """Build Google Sheets API service."""
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path:
         print("ERROR: GOOGLE_APPLICATION_CREDENTIALS env var not set", file=sys.stderr)
@@ -48,17 +49,24 @@ def get_spreadsheet_sheets(service, spreadsheet_id: str) -> list[dict]:
     ]
 
 
-def get_sheet_values(service, spreadsheet_id: str, sheet_title: str) -> list[list[str]]:
-    """Get all values from a sheet."""
+def get_sheet_values_batch(
+    service, spreadsheet_id: str, sheet_titles: list[str]
+) -> dict[str, list[list[str]]]:
+    """Get all values from several sheets in one request, keyed by sheet title."""
     try:
-        result = service.spreadsheets().values().get(
+        result = service.spreadsheets().values().batchGet(
             spreadsheetId=spreadsheet_id,
-            range=f"'{sheet_title}'",
+            ranges=[f"'{title}'" for title in sheet_titles],
             valueRenderOption="UNFORMATTED_VALUE"
         ).execute()
-        return result.get("values", [])
     except Exception:
-        return []
+        return {title: [] for title in sheet_titles}
+
+    value_ranges = result.get("valueRanges", [])
+    return {
+        title: value_range.get("values", [])
+        for title, value_range in zip(sheet_titles, value_ranges)
+    }
 
 
 def normalize_values(values: list[list]) -> list[list[str]]:
@@ -66,33 +74,21 @@ def normalize_values(values: list[list]) -> list[list[str]]:
     if not values:
         return []
 
-    normalized = []
-    for row in values:
-        norm_row = []
-        for cell in row:
-            if cell is None:
-                norm_row.append("")
-            elif isinstance(cell, str):
-                norm_row.append(cell.strip())
-            else:
-                norm_row.append(str(cell))
-        normalized.append(norm_row)
-
-    while normalized and all(c == "" for c in normalized[-1]):
-        normalized.pop()
-
-    if not normalized:
-        return []
+    normalized = [
+        ["" if cell is None else cell.strip() if type(cell) is str else str(cell) for cell in row]
+        for row in values
+    ]
 
-    max_col = 0
     for row in normalized:
         while row and row[-1] == "":
             row.pop()
-        max_col = max(max_col, len(row))
 
+    while normalized and not normalized[-1]:
+        normalized.pop()
+
+    max_col = max(map(len, normalized), default=0)
     for row in normalized:
-        while len(row) < max_col:
-            row.append("")
+        row.extend([""] * (max_col - len(row)))
 
     return normalized
 
@@ -199,7 +195,10 @@ def verify_match(service, template_id: str, runtime_id: str) -> bool:
     template_titles = {s["title"] for s in template_sheets}
     runtime_titles = {s["title"] for s in runtime_sheets}
 
-    if template_titles != runtime_titles:
+    all_match = template_titles == runtime_titles
+    titles = sorted(template_titles & runtime_titles)
+
+    if not all_match:
         print("FAIL: Sheet names mismatch", file=sys.stderr)
         print(f"  Template: {sorted(template_titles)}", file=sys.stderr)
         print(f"  Runtime:  {sorted(runtime_titles)}", file=sys.stderr)
@@ -209,20 +208,23 @@ def verify_match(service, template_id: str, runtime_id: str) -> bool:
             print(f"  Missing in runtime: {sorted(only_in_template)}", file=sys.stderr)
         if only_in_runtime:
             print(f"  Extra in runtime: {sorted(only_in_runtime)}", file=sys.stderr)
-        return False
-
-    print(f"Sheet names match: {sorted(template_titles)}")
+        if titles:
+            print(f"  Checking common sheets only: {titles}", file=sys.stderr)
+    else:
+        print(f"Sheet names match: {titles}")
     print()
 
-    all_match = True
-    for title in sorted(template_titles):
-        print(f"  Checking sheet '{title}'...")
+    if not titles:
+        return all_match
 
-        template_values = get_sheet_values(service, template_id, title)
-        runtime_values = get_sheet_values(service, runtime_id, title)
+    template_data = get_sheet_values_batch(service, template_id, titles)
+    runtime_data = get_sheet_values_batch(service, runtime_id, titles)
+
+    for title in titles:
+        print(f"  Checking sheet '{title}'...")
 
-        template_norm = normalize_values(template_values)
-        runtime_norm = normalize_values(runtime_values)
+        template_norm = normalize_values(template_data.get(title, []))
+        runtime_norm = normalize_values(runtime_data.get(title, []))
 
         if template_norm == runtime_norm:
             rows = len(template_norm)